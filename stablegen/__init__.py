@@ -1,6 +1,6 @@
 """StableGen addon - registration entry point.
 
-This module is intentionally thin: it assembles the *classes* list from
+This module is intentionally thin: it assembles the *classes* tuple from
 submodules, registers them with Blender, and delegates property
 registration to :pymod:`core.properties`.
 """
@@ -70,7 +70,7 @@ bl_info = {
 # ---------------------------------------------------------------------------
 # PropertyGroups first (they are referenced by CollectionProperty in
 # register_properties), then operators and preferences, then the panel last.
-classes = [
+classes = (
     # PropertyGroups
     CameraPromptItem,
     CameraOrderItem,
@@ -139,14 +139,20 @@ classes = [
     SceneQueueProcess,
     # Main panel (must be last – it uses all the above)
     StableGenPanel,
-]
-# Append debug classes (defined in debug_tools.py)
-classes.extend(_debug_classes)
+    # Debug classes (defined in debug_tools.py)
+    *_debug_classes,
+)
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    # A previous enable that failed part-way can leave some of these
+    # classes registered; drop them so registration doesn't raise.
+    for cls in reversed(classes):
+        if getattr(cls, "is_registered", False):
+            bpy.utils.unregister_class(cls)
+    _register_classes()
 
     register_properties(
         update_model_list=update_model_list,
@@ -168,8 +174,7 @@ def unregister():
         _sg_queue_load_handler=_sg_queue_load_handler,
     )
 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
 
 
 if __name__ == "__main__":
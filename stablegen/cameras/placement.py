@@ -770,9 +770,7 @@ class AddCameras(bpy.types.Operator):
                 cam_dir = cam_pos - mesh_center_np
                 label = _classify_camera_direction(cam_dir, ref_front)
                 cam_obj["sg_view_label"] = label
-                prompt_item = next(
-                    (item for item in context.scene.camera_prompts
-                     if item.name == cam_obj.name), None)
+                prompt_item = context.scene.camera_prompts.get(cam_obj.name)
                 if not prompt_item:
                     prompt_item = context.scene.camera_prompts.add()
                     prompt_item.name = cam_obj.name
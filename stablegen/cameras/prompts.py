@@ -43,8 +43,7 @@ class SG_UL_CameraOrderList(bpy.types.UIList):
         row.label(text=f"{index + 1}.")
         row.label(text=item.name, icon='CAMERA_DATA')
         # Show prompt preview if one exists
-        prompt_item = next(
-            (p for p in _context.scene.camera_prompts if p.name == item.name), None)
+        prompt_item = _context.scene.camera_prompts.get(item.name)
         if prompt_item and prompt_item.prompt:
             sub = row.row()
             sub.scale_x = 1.5
@@ -322,7 +321,7 @@ class CollectCameraPrompts(bpy.types.Operator):
         current_cam = self._cameras[self._camera_index]
 
         # Find existing prompt or set default
-        existing_item = next((item for item in context.scene.camera_prompts if item.name == current_cam.name), None)
+        existing_item = context.scene.camera_prompts.get(current_cam.name)
         self.camera_prompt = existing_item.prompt if existing_item else ""
 
         context.scene.camera = current_cam
@@ -339,7 +338,7 @@ class CollectCameraPrompts(bpy.types.Operator):
         cam_name = self._cameras[self._camera_index].name
 
         # Find existing item or add a new one
-        prompt_item = next((item for item in context.scene.camera_prompts if item.name == cam_name), None)
+        prompt_item = context.scene.camera_prompts.get(cam_name)
         if not prompt_item:
             prompt_item = context.scene.camera_prompts.add()
             prompt_item.name = cam_name
@@ -350,7 +349,7 @@ class CollectCameraPrompts(bpy.types.Operator):
         if self._camera_index < len(self._cameras):
             next_cam = self._cameras[self._camera_index]
             # Pre-fill next prompt
-            existing_item = next((item for item in context.scene.camera_prompts if item.name == next_cam.name), None)
+            existing_item = context.scene.camera_prompts.get(next_cam.name)
             self.camera_prompt = existing_item.prompt if existing_item else ""
             # Ensure scene camera is set for next dialog and switch view
             context.scene.camera = next_cam
@@ -88,8 +88,25 @@ def update_trellis2_generate_from(self, context):
 
 # ── Server-address change callback ────────────────────────────────────────
 
+_SERVER_CHECK_DELAY = 0.25
+# Set while update_combined runs so its own writes don't re-enter it
+_in_update_combined = False
+
+
 def update_combined(self, context):
     """Master callback for server_address changes — pings server, refreshes models."""
+    global _in_update_combined
+    if _in_update_combined:
+        return None
+    _in_update_combined = True
+    try:
+        _update_combined(self, context)
+    finally:
+        _in_update_combined = False
+    return None
+
+
+def _update_combined(self, context):
     # Import lazily to avoid circular ref at module level
     from .load_handlers import load_handler
 
@@ -105,8 +122,8 @@ def update_combined(self, context):
         clean_address = parsed_url.netloc
 
         if clean_address and raw_address != clean_address:
+            # Guarded: carry on with the cleaned address in this call
             prefs.server_address = clean_address
-            return None
 
     server_address = prefs.server_address
 
@@ -118,6 +135,34 @@ def update_combined(self, context):
         _state._cached_lora_list = [("NO_SERVER", "Set Server Address", "...")]
         return None
 
+    # Restart the timer on every change so the ping runs once, after the last edit
+    if bpy.app.timers.is_registered(_check_server_address):
+        bpy.app.timers.unregister(_check_server_address)
+    bpy.app.timers.register(_check_server_address, first_interval=_SERVER_CHECK_DELAY)
+
+    update_parameters(self, context)
+    load_handler(None)
+
+    return None
+
+
+def cancel_server_check():
+    """Drop a pending debounced server check (used when unregistering)."""
+    if bpy.app.timers.is_registered(_check_server_address):
+        bpy.app.timers.unregister(_check_server_address)
+
+
+def _check_server_address():
+    """Ping the configured server and refresh model lists (timer callback)."""
+    from .load_handlers import load_handler
+
+    prefs_wrapper = bpy.context.preferences.addons.get(ADDON_PKG)
+    if prefs_wrapper is None:
+        return None
+    server_address = prefs_wrapper.preferences.server_address
+    if not server_address:
+        return None
+
     print("[StableGen] Server address changed, checking asynchronously...")
 
     def _bg_work():
@@ -159,8 +204,4 @@ def update_combined(self, context):
         bpy.app.timers.register(_deferred_refresh, first_interval=0.1)
 
     _run_async(_bg_work, _on_done, track_generation=True)
-
-    update_parameters(self, context)
-    load_handler(None)
-
     return None
@@ -1,6 +1,7 @@
 """Persistent load_post handler for scene defaults and cache sync.
 
-The ``load_handler`` function runs on every .blend file load to:
+The ``load_handler`` function runs on every .blend file load and schedules
+a short timer; rapid successive loads collapse into a single pass that will:
 - set default ControlNet / LoRA units
 - re-register crop overlays
 - trigger a checkpoint cache refresh if the architecture changed
@@ -12,9 +13,31 @@ from bpy.app.handlers import persistent
 
 from . import ADDON_PKG
 
+_LOAD_DRAIN_DELAY = 0.1
+
 
 @persistent
 def load_handler(dummy):
+    """Queue the post-load sync; repeated loads before it runs share one pass."""
+    if not bpy.app.timers.is_registered(_drain_load):
+        bpy.app.timers.register(_drain_load, first_interval=_LOAD_DRAIN_DELAY)
+
+
+def cancel_pending_load():
+    """Drop a queued post-load sync (used when unregistering)."""
+    if bpy.app.timers.is_registered(_drain_load):
+        bpy.app.timers.unregister(_drain_load)
+
+
+def _drain_load():
+    try:
+        _sync_loaded_scene()
+    except Exception as e:
+        print(f"[StableGen] StableGen Load Handler: {e}")
+    return None
+
+
+def _sync_loaded_scene():
     """Set default ControlNet/LoRA units and sync checkpoint cache on file load."""
     from ..ui.model_units import get_lora_models
     from . import state as _state
@@ -60,8 +83,7 @@ def load_handler(dummy):
             found_lora_identifier_to_load = None
             for identifier, name, description in all_available_loras_enums:
                 if identifier.endswith(default_lora_filename_to_find):
-                    if identifier not in ("NONE_AVAILABLE", "NO_COMFYUI_DIR_LORA", "NO_LORAS_SUBDIR",
-                                          "PERM_ERROR", "SCAN_ERROR", "NONE_FOUND"):
+                    if identifier not in _state._MODEL_SENTINEL_IDS:
                         found_lora_identifier_to_load = identifier
                         break
 
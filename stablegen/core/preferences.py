@@ -23,6 +23,7 @@ from .server_api import (
 from .state import (
     _dec_pending_refreshes,
     _inc_pending_refreshes,
+    _invalidate_controlnet_items,
     _run_async,
 )
 from ..timeout_config import get_timeout
@@ -32,22 +33,28 @@ from ..timeout_config import get_timeout
 
 class ControlNetModelMappingItem(bpy.types.PropertyGroup):
     """Stores info about a detected ControlNet model and its supported types."""
-    name: bpy.props.StringProperty(name="Model Filename")  # type: ignore
+    name: bpy.props.StringProperty(
+        name="Model Filename",
+        update=_invalidate_controlnet_items
+    )  # type: ignore
 
     supports_depth: bpy.props.BoolProperty(
         name="Depth",
         description="Check if this model supports Depth guidance",
-        default=False
+        default=False,
+        update=_invalidate_controlnet_items
     )  # type: ignore
     supports_canny: bpy.props.BoolProperty(
         name="Canny",
         description="Check if this model supports Canny/Edge guidance",
-        default=False
+        default=False,
+        update=_invalidate_controlnet_items
     )  # type: ignore
     supports_normal: bpy.props.BoolProperty(
         name="Normal",
         description="Check if this model supports Normal map guidance",
-        default=False
+        default=False,
+        update=_invalidate_controlnet_items
     )  # type: ignore
 
 
@@ -384,6 +391,8 @@ class RefreshControlNetMappings(bpy.types.Operator):
 
                 print(f"[StableGen] ControlNet refresh: {len(models_to_add)} added, {len(models_to_remove)} removed.")
 
+            _invalidate_controlnet_items()
+
             for window in bpy.context.window_manager.windows:
                 for area in window.screen.areas:
                     area.tag_redraw()
@@ -7,9 +7,10 @@ collected here in ``register_properties()`` and ``unregister_properties()``.
 
 import bpy  # pylint: disable=import-error
 
-from ..ui.presets import update_parameters, get_preset_items
+from ..ui.presets import cancel_parameter_update, update_parameters, get_preset_items
 from ..cameras.prompts import CameraPromptItem, CameraOrderItem
 from .callbacks import (
+    cancel_server_check,
     update_architecture_mode,
     update_combined,
     update_trellis2_generate_from,
@@ -17,32 +18,259 @@ from .callbacks import (
     update_trellis2_texture_mode,
 )
 from . import ADDON_PKG
+from .load_handlers import cancel_pending_load
+
+
+# ── Static enum items ──────────────────────────────────────────────────────
+# The sampler/scheduler lists are shared with the refine pass properties;
+# the long generation-method lists are kept out of register_properties().
+# Blender copies static items into RNA once, at registration.
+
+_SAMPLER_ITEMS = (
+    ('euler', 'Euler', ''),
+    ('euler_ancestral', 'Euler A', ''),
+    ('dpmpp_sde', 'DPM++ SDE', ''),
+    ('dpmpp_2m', 'DPM++ 2M', ''),
+    ('dpmpp_2s_ancestral', 'DPM++ 2S Ancestral', ''),
+)
+
+_SCHEDULER_ITEMS = (
+    ('sgm_uniform', 'SGM Uniform', ''),
+    ('karras', 'Karras', ''),
+    ('beta', 'Beta', ''),
+    ('normal', 'Normal', ''),
+    ('simple', 'Simple', ''),
+)
+
+_GENERATION_METHOD_ITEMS = (
+    ('separate', 'Generate Separately', 'Generates images one by one for each viewpoint. Each image is generated independently using only its own control signals (e.g., depth map) without context from other views. All images are applied at the end.'),
+    ('sequential', 'Generate Sequentially', 'Generates images viewpoint by viewpoint. After the first view, each subsequent view is generated using inpainting, guided by a visibility mask and an RGB render of the texture projected from previous viewpoints to maintain consistency.'),
+    ('grid', 'Generate Using Grid', 'Combines control signals from all viewpoints into a single grid, generates a single image, then splits it back into individual viewpoint textures. Faster but lower resolution per view. Includes an optional second pass to refine each split image individually at full resolution for improved quality.'),
+    ('refine', 'Refine/Restyle Texture (Img2Img)', 'Uses the current rendered texture appearance as input for an img2img generation pass. Replaces the previous material with the new result. Good for restyling or globally changing the look of an existing texture. Works on any existing material setup.'),
+    ('local_edit', 'Local Edit', 'Make localized changes to an existing texture. Point cameras at areas you want to modify — the new generation blends over the original using angle and vignette-based feathering, preserving untouched areas. Works only with StableGen generated textures.'),
+    ('uv_inpaint', 'UV Inpaint Missing Areas', 'Identifies untextured areas on a standard UV map using a visibility calculation. Performs baking if not baked already. Performs diffusion inpainting directly on the UV texture map to fill only these missing regions, using the surrounding texture as context.'),
+)
+
+_QWEN_GENERATION_METHOD_ITEMS = (
+    ('generate', 'Generate', 'Standard generation mode'),
+    ('refine', 'Refine', 'Refine/restyle the entire texture using Qwen Image Edit. Replaces the existing material with the new result. Describe the desired look in the prompt — you can completely change the style, color scheme, or overall appearance.'),
+    ('local_edit', 'Local Edit', 'Make targeted changes to specific areas of the texture. Point cameras at what you want to change and describe the edit — you can change colors, add details, sharpen, alter text, or restyle selected parts. Untouched areas are preserved.'),
+)
+
+_UPSCALE_METHOD_ITEMS = (
+    ('nearest-exact', 'Nearest Exact', ''),
+    ('bilinear', 'Bilinear', ''),
+    ('bicubic', 'Bicubic', ''),
+    ('lanczos', 'Lanczos', ''),
+)
+
+# Long multi-paragraph tooltips, kept out of register_properties().
+_DESC_WEIGHT_EXPONENT = (
+    "Controls the falloff curve for viewpoint weighting based on the angle to the surface normal (\u03b8). "
+    "Weight = |cos(\u03b8)|^Exponent. Higher values prioritize straight-on views more strongly, creating sharper transitions. "
+    "1.0 = standard |cos(\u03b8)| weighting."
+)
+_DESC_SEQUENTIAL_SMOOTH = (
+    "Use smooth visibility map for sequential generation mode. Disabling this uses a binary visibility map and may need more mask blurring to reduce artifacts.\n"
+    "\n"
+    " - Visibility map is a mask that indicates which pixels have textures already projected from previous viewpoints.\n"
+    " - Both methods are using weights which are calculated based on the angle between the surface normal and the camera view direction.\n"
+    " - 'Smooth' uses these calculated weights directly (0.0-1.0 range, giving gradual transitions). The transition point can be further tuned by the 'Smooth Factor' parameters.\n"
+    " - Disabling 'Smooth' thresholds these weights to create a hard-edged binary mask (0.0 or 1.0)."
+)
+_DESC_DIFFERENTIAL_DIFFUSION = (
+    "Replace standard inpainting with a differential diffusion based workflow\n"
+    "\n"
+    " - Generally works better and reduces artifacts.\n"
+    " - Using a Smooth Visibilty Map is recommended for Sequential Mode."
+)
+
+
+# Collapsible panel sections: (scene attribute, label, description).
+_PANEL_TOGGLES = (
+    ("show_core_settings", "Core Generation Settings",
+     "Parameters used for the image generation process. Also includes LoRAs for faster generation."),
+    ("show_lora_settings", "LoRA Settings", "Settings for custom LoRA management."),
+    ("show_camera_options", "Camera Settings", "Camera prompt and generation order settings."),
+    ("show_scene_understanding_settings", "Viewpoint Blending Settings",
+     "Settings for how the addon blends different viewpoints together."),
+    ("show_output_material_settings", "Output & Material Settings",
+     "Settings for output characteristics and material handling, including texture processing and final image resolution."),
+    ("show_image_guidance_settings", "Image Guidance (IPAdapter & ControlNet)",
+     "Configuration for advanced image guidance techniques, allowing more precise control via reference images or structural inputs."),
+    ("show_masking_inpainting_settings", "Inpainting Options",
+     "Parameters for inpainting and mask manipulation to refine specific image areas. (Visible for UV Inpaint & Sequential modes)."),
+    ("show_mode_specific_settings", "Generation Mode Specifics",
+     "Parameters exclusively available for the selected Generation Mode, allowing tailored control over mode-dependent behaviors."),
+)
+
+# Per-map PBR tiling switches: (scene attribute, label, description, default).
+_PBR_TILE_TOGGLES = (
+    ("pbr_tile_albedo", "Tile Albedo", "Tile the albedo map for higher detail", True),
+    ("pbr_tile_material", "Tile Material",
+     "Tile the roughness and metallic maps (both come from the same IID-Appearance material output)", False),
+    ("pbr_tile_normal", "Tile Normal", "Tile the normal map for higher detail", False),
+    ("pbr_tile_height", "Tile Height", "Tile the height/displacement map for higher detail", False),
+    ("pbr_tile_emission", "Tile Emission",
+     "Tile the IID-Lighting residual used for emission (only applies to the Residual emission method)", False),
+)
 
 
 # ── Helper(s) used by properties ───────────────────────────────────────────
 
+# Dynamic ``items=`` callbacks must return lists that stay referenced, so
+# every variant is built once and keyed by (local_edit, trellis2).
+_IPADAPTER_MODE_BASE = (
+    ('first', 'Use first generated image', '', 0),
+    ('recent', 'Use most recent generated image', '', 1),
+)
+_IPADAPTER_MODE_ORIGINAL_RENDER = (
+    'original_render', 'Use original render',
+    'Uses the existing texture render from each camera viewpoint as IPAdapter reference', 2)
+_IPADAPTER_MODE_TRELLIS2_INPUT = (
+    'trellis2_input', 'Use TRELLIS.2 input image',
+    'Uses the input image from TRELLIS.2 mesh generation as IPAdapter reference', 3)
+_IPADAPTER_MODE_ITEMS = {
+    (local_edit, trellis2): list(_IPADAPTER_MODE_BASE)
+    + ([_IPADAPTER_MODE_ORIGINAL_RENDER] if local_edit else [])
+    + ([_IPADAPTER_MODE_TRELLIS2_INPUT] if trellis2 else [])
+    for local_edit in (False, True) for trellis2 in (False, True)
+}
+
+
 def _get_ipadapter_mode_items(self, context):
-    items = [
-        ('first', 'Use first generated image', '', 0),
-        ('recent', 'Use most recent generated image', '', 1),
-    ]
-    if context:
-        is_local_edit = (
-            context.scene.generation_method == 'local_edit'
-            or (context.scene.model_architecture.startswith('qwen')
-                and context.scene.qwen_generation_method == 'local_edit')
-        )
-        if is_local_edit:
-            items.append(('original_render', 'Use original render',
-                          'Uses the existing texture render from each camera viewpoint as IPAdapter reference', 2))
-        if getattr(context.scene, 'architecture_mode', '') == 'trellis2':
-            items.append(('trellis2_input', 'Use TRELLIS.2 input image',
-                          'Uses the input image from TRELLIS.2 mesh generation as IPAdapter reference', 3))
-    return items
+    if not context:
+        return _IPADAPTER_MODE_ITEMS[(False, False)]
+    scene = context.scene
+    is_local_edit = (
+        scene.generation_method == 'local_edit'
+        or (scene.model_architecture.startswith('qwen')
+            and scene.qwen_generation_method == 'local_edit')
+    )
+    is_trellis2 = getattr(scene, 'architecture_mode', '') == 'trellis2'
+    return _IPADAPTER_MODE_ITEMS[(is_local_edit, is_trellis2)]
 
 
 # ── Registration ───────────────────────────────────────────────────────────
 
+# Every property ``register_properties`` assigns, by owner.  Static so that
+# ``unregister_properties`` can remove them even after a partial register or
+# a module reload; add new properties here as well as in register.
+_WM_PROPS = (
+    'sg_scene_queue', 'sg_scene_queue_index', 'sg_show_queue',
+    'sg_queue_gif_export', 'sg_queue_gif_duration', 'sg_queue_gif_fps',
+    'sg_queue_gif_resolution', 'sg_queue_gif_samples', 'sg_queue_gif_engine',
+    'sg_queue_gif_interpolation', 'sg_queue_gif_use_hdri', 'sg_queue_gif_hdri_path',
+    'sg_queue_gif_hdri_strength', 'sg_queue_gif_hdri_rotation',
+    'sg_queue_gif_env_mode', 'sg_queue_gif_denoiser', 'sg_queue_gif_use_gpu',
+    'sg_queue_gif_also_no_pbr', 'sg_batch_running', 'sg_batch_index',
+    'sg_batch_total',
+)
+_SCENE_PROPS = (
+    'comfyui_prompt', 'use_separate_texture_prompt', 'texture_prompt',
+    'comfyui_negative_prompt', 'model_name', 'sg_model_name_backup', 'seed',
+    'control_after_generate', 'steps', 'cfg', 'sampler', 'scheduler',
+    'show_advanced_params', 'show_generation_params', 'auto_rescale',
+    'qwen_rescale_alignment', 'auto_rescale_target_mp', 'use_ipadapter',
+    'ipadapter_image', 'ipadapter_strength', 'ipadapter_start', 'ipadapter_end',
+    'ipadapter_weight_type', 'sequential_ipadapter', 'sequential_ipadapter_mode',
+    'sequential_desaturate_factor', 'sequential_contrast_factor',
+    'sequential_ipadapter_regenerate',
+    'sequential_ipadapter_regenerate_wo_controlnet', 'generation_method',
+    'qwen_generation_method', 'qwen_refine_use_prev_ref', 'qwen_refine_use_depth',
+    'qwen_timestep_zero_ref', 'refine_images', 'refine_steps', 'refine_sampler',
+    'refine_scheduler', 'denoise', 'refine_cfg', 'refine_prompt',
+    'refine_upscale_method', 'generation_status', 'sg_last_gen_error',
+    'generation_progress', 'overwrite_material', 'bake_visibility_weights',
+    'discard_factor', 'discard_factor_generation_only',
+    'discard_factor_after_generation', 'weight_exponent_generation_only',
+    'weight_exponent_after_generation', 'view_blend_use_color_match',
+    'view_blend_color_match_method', 'view_blend_color_match_strength',
+    'weight_exponent', 'allow_modify_existing_textures', 'ask_object_prompts',
+    'fallback_color', 'sequential_smooth', 'weight_exponent_mask',
+    'canny_threshold_low', 'canny_threshold_high', 'sequential_factor_smooth',
+    'sequential_factor_smooth_2', 'sequential_factor', 'differential_noise',
+    'grow_mask_by', 'mask_blocky', 'visibility_vignette',
+    'visibility_vignette_width', 'visibility_vignette_softness',
+    'visibility_vignette_blur', 'sg_silhouette_margin', 'sg_silhouette_depth',
+    'sg_silhouette_rays', 'refine_angle_ramp_active', 'refine_angle_ramp_pos_0',
+    'refine_angle_ramp_pos_1', 'refine_feather_ramp_pos_0',
+    'refine_feather_ramp_pos_1', 'refine_edge_feather_projection',
+    'refine_edge_feather_width', 'refine_edge_feather_softness',
+    'differential_diffusion', 'blur_mask', 'blur_mask_radius', 'blur_mask_sigma',
+    'sequential_custom_camera_order', 'clip_skip', 'stablegen_preset',
+    'active_preset', 'model_architecture', 'architecture_mode',
+    'trellis2_generate_from', 'trellis2_texture_mode',
+    'trellis2_initial_image_arch', 'trellis2_camera_count',
+    'trellis2_placement_mode', 'trellis2_auto_prompts', 'trellis2_exclude_bottom',
+    'trellis2_exclude_bottom_angle', 'trellis2_auto_aspect',
+    'trellis2_occlusion_mode', 'trellis2_consider_existing',
+    'trellis2_delete_cameras', 'trellis2_coverage_target',
+    'trellis2_max_auto_cameras', 'trellis2_fan_angle', 'trellis2_import_scale',
+    'trellis2_shade_mode', 'trellis2_clamp_elevation', 'trellis2_max_elevation',
+    'trellis2_min_elevation', 'trellis2_preview_gallery_enabled',
+    'trellis2_preview_gallery_count', 'qwen_guidance_map_type', 'qwen_voronoi_mode',
+    'qwen_context_render_mode', 'qwen_use_external_style_image',
+    'qwen_external_style_image', 'qwen_external_style_initial_only',
+    'qwen_use_custom_prompts', 'qwen_custom_prompt_initial',
+    'qwen_custom_prompt_seq_none', 'qwen_custom_prompt_seq_replace',
+    'qwen_custom_prompt_seq_additional', 'qwen_guidance_fallback_color',
+    'qwen_guidance_background_color', 'qwen_context_cleanup',
+    'qwen_context_cleanup_hue_tolerance', 'qwen_context_cleanup_value_adjust',
+    'qwen_context_fallback_dilation', 'qwen_prompt_gray_background',
+    'output_timestamp', 'camera_prompts', 'use_camera_prompts', 'sg_camera_order',
+    'sg_camera_order_index', 'sg_use_custom_camera_order', 'generation_mode',
+    'early_priority_strength', 'early_priority', 'texture_objects', 'use_flux_lora',
+    'controlnet_units', 'lora_units', 'controlnet_units_index', 'lora_units_index',
+    'trellis2_available', 'pbr_nodes_available', 'show_trellis2_params',
+    'show_trellis2_advanced', 'show_trellis2_mesh_settings',
+    'show_trellis2_texture_settings', 'show_trellis2_camera_settings',
+    'trellis2_last_input_image', 'qwen_use_trellis2_style',
+    'qwen_trellis2_style_initial_only', 'trellis2_pipeline_active',
+    'trellis2_pipeline_phase_start_pct', 'trellis2_pipeline_total_phases',
+    'trellis2_input_image', 'trellis2_batch_folder', 'trellis2_batch_count',
+    'trellis2_batch_rename_meshes', 'trellis2_resolution', 'trellis2_vram_mode',
+    'trellis2_attn_backend', 'trellis2_seed', 'trellis2_ss_guidance',
+    'trellis2_ss_steps', 'trellis2_shape_guidance', 'trellis2_shape_steps',
+    'trellis2_tex_guidance', 'trellis2_tex_steps', 'trellis2_max_tokens',
+    'trellis2_texture_size', 'trellis2_decimation', 'trellis2_remesh',
+    'trellis2_post_processing_enabled', 'trellis2_auto_lighting',
+    'trellis2_skip_texture', 'trellis2_bg_removal', 'trellis2_background_color',
+    'pbr_decomposition', 'pbr_albedo_source', 'pbr_map_albedo', 'pbr_map_roughness',
+    'pbr_map_metallic', 'pbr_map_normal', 'pbr_normal_strength',
+    'pbr_delight_strength', 'pbr_map_height', 'pbr_height_scale', 'pbr_map_ao',
+    'pbr_ao_samples', 'pbr_ao_distance', 'pbr_map_emission', 'pbr_emission_method',
+    'pbr_emission_threshold', 'pbr_emission_saturation_min',
+    'pbr_emission_value_min', 'pbr_emission_bloom', 'pbr_emission_strength',
+    'pbr_use_native_resolution', 'pbr_tiling', 'pbr_tile_grid', 'pbr_tile_superres',
+    'pbr_processing_resolution', 'pbr_denoise_steps', 'pbr_ensemble_size',
+    'pbr_albedo_auto_saturation', 'pbr_albedo_saturation_mode',
+    'pbr_replace_color_with_albedo', 'pbr_auto_lighting',
+    *(toggle[0] for toggle in _PANEL_TOGGLES),
+    *(toggle[0] for toggle in _PBR_TILE_TOGGLES),
+)
+_PROP_NAMES = ((bpy.types.WindowManager, _WM_PROPS), (bpy.types.Scene, _SCENE_PROPS))
+
+# Scene properties from older versions that may still be attached.
+_LEGACY_SCENE_PROPS = ('controlnet_model_mappings', 'controlnet_mapping_index', 'pbr_model_variant')
+
+
+def _add_load_post_handler(handler):
+    """Append *handler* to load_post exactly once.
+
+    A script reload creates new function objects, so stale copies left
+    behind by a previous registration are matched by module and name.
+    """
+    handlers = bpy.app.handlers.load_post
+    for existing in list(handlers):
+        if (existing is not handler
+                and getattr(existing, '__module__', None) == handler.__module__
+                and getattr(existing, '__name__', None) == handler.__name__):
+            handlers.remove(existing)
+    if handler not in handlers:
+        handlers.append(handler)
+
+
 def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
                         SceneQueueItem, load_handler, _sg_queue_load_handler,
                         _sg_queue_load):
@@ -51,7 +279,6 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     Parameters are passed in to avoid circular imports — the caller
     (``__init__.register``) already has them resolved.
     """
-
     # --- Scene Queue properties (on WindowManager so they're global) ---
     bpy.types.WindowManager.sg_scene_queue = bpy.props.CollectionProperty(
         type=SceneQueueItem, name="Scene Queue"
@@ -167,8 +394,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.comfyui_prompt = bpy.props.StringProperty(
         name="ComfyUI Prompt",
         description="Text prompt for generation (also used for texturing unless a separate texture prompt is provided)",
-        default="gold cube",
-        update=update_parameters
+        default="gold cube"
     )
     bpy.types.Scene.use_separate_texture_prompt = bpy.props.BoolProperty(
         name="Use Separate Texture Prompt",
@@ -189,8 +415,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.comfyui_negative_prompt = bpy.props.StringProperty(
         name="ComfyUI Negative Prompt",
         description="Enter the negative text prompt for ComfyUI generation",
-        default="",
-        update=update_parameters
+        default=""
     )
     bpy.types.Scene.model_name = bpy.props.EnumProperty(
         name="Model Name",
@@ -224,51 +449,40 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     )
     bpy.types.Scene.steps = bpy.props.IntProperty(
         name="Steps",
-        description="Number of denoising steps. Higher values improve detail and coherence but take longer",
-        default=8, min=0, max=200,
+        description="Number of denoising steps. Higher values improve detail and coherence but take longer. "
+                    "DPM++ samplers converge near 10-20 steps; higher values rarely improve quality",
+        default=8, min=0, max=200, soft_max=30,
         update=update_parameters
     )
     bpy.types.Scene.cfg = bpy.props.FloatProperty(
         name="CFG",
         description="Classifier-Free Guidance scale. Higher values follow the prompt more strictly but may reduce quality; lower values give more creative freedom",
-        default=1.5, min=0.0, max=100.0,
+        default=1.5, min=0.0, max=100.0, soft_max=20.0, step=10, precision=2,
         update=update_parameters
     )
     bpy.types.Scene.sampler = bpy.props.EnumProperty(
         name="Sampler",
         description="Sampler for generation",
-        items=[
-            ('euler', 'Euler', ''),
-            ('euler_ancestral', 'Euler A', ''),
-            ('dpmpp_sde', 'DPM++ SDE', ''),
-            ('dpmpp_2m', 'DPM++ 2M', ''),
-            ('dpmpp_2s_ancestral', 'DPM++ 2S Ancestral', ''),
-        ],
+        items=_SAMPLER_ITEMS,
         default='dpmpp_2s_ancestral',
         update=update_parameters
     )
     bpy.types.Scene.scheduler = bpy.props.EnumProperty(
         name="Scheduler",
         description="Scheduler for generation",
-        items=[
-            ('sgm_uniform', 'SGM Uniform', ''),
-            ('karras', 'Karras', ''),
-            ('beta', 'Beta', ''),
-            ('normal', 'Normal', ''),
-            ('simple', 'Simple', ''),
-        ],
+        items=_SCHEDULER_ITEMS,
         default='sgm_uniform',
         update=update_parameters
     )
     bpy.types.Scene.show_advanced_params = bpy.props.BoolProperty(
         name="Show Advanced Parameters",
         description="Show or hide advanced parameters",
-        default=False, update=update_parameters
+        default=False
     )
     bpy.types.Scene.show_generation_params = bpy.props.BoolProperty(
         name="Show Generation Parameters",
         description="Toggle visibility of core generation settings (steps, CFG, sampler, scheduler, seed)",
-        default=True, update=update_parameters
+        default=True
     )
     bpy.types.Scene.auto_rescale = bpy.props.BoolProperty(
         name="Auto Rescale Resolution",
@@ -312,25 +526,24 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.ipadapter_image = bpy.props.StringProperty(
         name="Reference Image",
         description="Path to the reference image",
-        default="", subtype='FILE_PATH',
-        update=update_parameters
+        default="", subtype='FILE_PATH'
     )
     bpy.types.Scene.ipadapter_strength = bpy.props.FloatProperty(
         name="IPAdapter Strength",
         description="Strength for IPAdapter",
-        default=1.0, min=-1.0, max=3.0,
+        default=1.0, min=-1.0, max=3.0, step=5, precision=2,
         update=update_parameters
     )
     bpy.types.Scene.ipadapter_start = bpy.props.FloatProperty(
         name="IPAdapter Start",
         description="Start percentage for IPAdapter (/100)",
-        default=0.0, min=0.0, max=1.0,
+        default=0.0, min=0.0, max=1.0, subtype='FACTOR', step=5, precision=2,
         update=update_parameters
     )
     bpy.types.Scene.ipadapter_end = bpy.props.FloatProperty(
         name="IPAdapter End",
         description="End percentage for IPAdapter (/100)",
-        default=1.0, min=0.0, max=1.0,
+        default=1.0, min=0.0, max=1.0, subtype='FACTOR', step=5, precision=2,
         update=update_parameters
     )
     bpy.types.Scene.ipadapter_weight_type = bpy.props.EnumProperty(
@@ -382,25 +595,14 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.generation_method = bpy.props.EnumProperty(
         name="Generation Mode",
         description="Choose the mode for generating images",
-        items=[
-            ('separate', 'Generate Separately', 'Generates images one by one for each viewpoint. Each image is generated independently using only its own control signals (e.g., depth map) without context from other views. All images are applied at the end.'),
-            ('sequential', 'Generate Sequentially', 'Generates images viewpoint by viewpoint. After the first view, each subsequent view is generated using inpainting, guided by a visibility mask and an RGB render of the texture projected from previous viewpoints to maintain consistency.'),
-            ('grid', 'Generate Using Grid', 'Combines control signals from all viewpoints into a single grid, generates a single image, then splits it back into individual viewpoint textures. Faster but lower resolution per view. Includes an optional second pass to refine each split image individually at full resolution for improved quality.'),
-            ('refine', 'Refine/Restyle Texture (Img2Img)', 'Uses the current rendered texture appearance as input for an img2img generation pass. Replaces the previous material with the new result. Good for restyling or globally changing the look of an existing texture. Works on any existing material setup.'),
-            ('local_edit', 'Local Edit', 'Make localized changes to an existing texture. Point cameras at areas you want to modify — the new generation blends over the original using angle and vignette-based feathering, preserving untouched areas. Works only with StableGen generated textures.'),
-            ('uv_inpaint', 'UV Inpaint Missing Areas', 'Identifies untextured areas on a standard UV map using a visibility calculation. Performs baking if not baked already. Performs diffusion inpainting directly on the UV texture map to fill only these missing regions, using the surrounding texture as context.'),
-        ],
+        items=_GENERATION_METHOD_ITEMS,
         default='sequential',
         update=update_parameters
     )
     bpy.types.Scene.qwen_generation_method = bpy.props.EnumProperty(
         name="Generation Mode",
         description="Choose the mode for generating images with Qwen",
-        items=[
-            ('generate', 'Generate', 'Standard generation mode'),
-            ('refine', 'Refine', 'Refine/restyle the entire texture using Qwen Image Edit. Replaces the existing material with the new result. Describe the desired look in the prompt — you can completely change the style, color scheme, or overall appearance.'),
-            ('local_edit', 'Local Edit', 'Make targeted changes to specific areas of the texture. Point cameras at what you want to change and describe the edit — you can change colors, add details, sharpen, alter text, or restyle selected parts. Untouched areas are preserved.'),
-        ],
+        items=_QWEN_GENERATION_METHOD_ITEMS,
         default='generate',
         update=update_parameters
     )
@@ -425,42 +627,31 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     # ── Refine settings ────────────────────────────────────────────────
     bpy.types.Scene.refine_images = bpy.props.BoolProperty(
         name="Refine Images",
-        description="Refine images after generation",
+        description="Refine images after generation. In Grid mode this adds one img2img pass per viewpoint at full resolution; leave it off for the fastest single-diffusion result",
         default=False, update=update_parameters
     )
     bpy.types.Scene.refine_steps = bpy.props.IntProperty(
-        name="Refine Steps", description="Number of steps for refining",
-        default=8, min=0, max=200, update=update_parameters
+        name="Refine Steps",
+        description="Number of steps for refining. DPM++ samplers converge near 10-20 steps; higher values rarely improve quality",
+        default=8, min=0, max=200, soft_max=30, update=update_parameters
     )
     bpy.types.Scene.refine_sampler = bpy.props.EnumProperty(
         name="Refine Sampler", description="Sampler for refining",
-        items=[
-            ('euler', 'Euler', ''),
-            ('euler_ancestral', 'Euler A', ''),
-            ('dpmpp_sde', 'DPM++ SDE', ''),
-            ('dpmpp_2m', 'DPM++ 2M', ''),
-            ('dpmpp_2s_ancestral', 'DPM++ 2S Ancestral', ''),
-        ],
-        default='dpmpp_2s_ancestral', update=update_parameters
+        items=_SAMPLER_ITEMS,
+        default='dpmpp_2m', update=update_parameters
     )
     bpy.types.Scene.refine_scheduler = bpy.props.EnumProperty(
         name="Refine Scheduler", description="Scheduler for refining",
-        items=[
-            ('sgm_uniform', 'SGM Uniform', ''),
-            ('karras', 'Karras', ''),
-            ('beta', 'Beta', ''),
-            ('normal', 'Normal', ''),
-            ('simple', 'Simple', ''),
-        ],
-        default='sgm_uniform', update=update_parameters
+        items=_SCHEDULER_ITEMS,
+        default='karras', update=update_parameters
     )
     bpy.types.Scene.denoise = bpy.props.FloatProperty(
         name="Denoise", description="Denoise level for refining",
-        default=0.8, min=0.0, max=1.0, update=update_parameters
+        default=0.8, min=0.0, max=1.0, subtype='FACTOR', step=5, precision=2, update=update_parameters
     )
     bpy.types.Scene.refine_cfg = bpy.props.FloatProperty(
         name="Refine CFG", description="Classifier-Free Guidance scale for refining",
-        default=1.5, min=0.0, max=100.0, update=update_parameters
+        default=1.5, min=0.0, max=100.0, soft_max=20.0, step=10, precision=2, update=update_parameters
     )
     bpy.types.Scene.refine_prompt = bpy.props.StringProperty(
         name="Refine Prompt",
@@ -469,12 +660,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     )
     bpy.types.Scene.refine_upscale_method = bpy.props.EnumProperty(
         name="Refine Upscale Method", description="Upscale method for refining",
-        items=[
-            ('nearest-exact', 'Nearest Exact', ''),
-            ('bilinear', 'Bilinear', ''),
-            ('bicubic', 'Bicubic', ''),
-            ('lanczos', 'Lanczos', ''),
-        ],
+        items=_UPSCALE_METHOD_ITEMS,
         default='lanczos', update=update_parameters
     )
 
@@ -487,7 +673,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
             ('waiting', 'Waiting for cancel', ''),
             ('error', 'Error', '')
         ],
-        default='idle', update=update_parameters
+        default='idle'
     )
     bpy.types.Scene.sg_last_gen_error = bpy.props.BoolProperty(
         name="Last Generation Error",
@@ -496,7 +682,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     )
     bpy.types.Scene.generation_progress = bpy.props.FloatProperty(
         name="Generation Progress", description="Current progress of image generation",
-        default=0.0, min=0.0, max=100.0, update=update_parameters
+        default=0.0, min=0.0, max=100.0, subtype='PERCENTAGE'
     )
 
     # ── Material / blending ────────────────────────────────────────────
@@ -516,7 +702,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.discard_factor = bpy.props.FloatProperty(
         name="Discard Factor",
         description="If the texture is facing the camera at an angle greater than this value, it will be discarded. This is useful for preventing artifacts from the very edge of the generated texture appearing when keeping high discard factor (use ~65 for best results when generating textures around an object)",
-        default=90.0, min=0.0, max=180.0, update=update_parameters
+        default=90.0, min=0.0, max=180.0, step=100, precision=1, update=update_parameters
     )
     bpy.types.Scene.discard_factor_generation_only = bpy.props.BoolProperty(
         name="Reset Discard Angle After Generation",
@@ -563,10 +749,8 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     )
     bpy.types.Scene.weight_exponent = bpy.props.FloatProperty(
         name="Weight Exponent",
-        description="Controls the falloff curve for viewpoint weighting based on the angle to the surface normal (\u03b8). "
-                    "Weight = |cos(\u03b8)|^Exponent. Higher values prioritize straight-on views more strongly, creating sharper transitions. "
-                    "1.0 = standard |cos(\u03b8)| weighting.",
-        default=3.0, min=0.1, max=1000.0, update=update_parameters
+        description=_DESC_WEIGHT_EXPONENT,
+        default=3.0, min=0.1, max=1000.0, step=10, precision=2, update=update_parameters
     )
     bpy.types.Scene.allow_modify_existing_textures = bpy.props.BoolProperty(
         name="Allow modifying existing textures",
@@ -581,14 +765,14 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.fallback_color = bpy.props.FloatVectorProperty(
         name="Fallback Color",
         description="Color to use as fallback in texture generation",
-        subtype='COLOR', default=(0.0, 0.0, 0.0), min=0.0, max=1.0,
+        subtype='COLOR', size=3, default=(0.0, 0.0, 0.0), min=0.0, max=1.0,
         update=update_parameters
     )
 
     # ── Sequential / masking / inpainting ──────────────────────────────
     bpy.types.Scene.sequential_smooth = bpy.props.BoolProperty(
         name="Sequential Smooth",
-        description="Use smooth visibility map for sequential generation mode. Disabling this uses a binary visibility map and may need more mask blurring to reduce artifacts.\n\n - Visibility map is a mask that indicates which pixels have textures already projected from previous viewpoints.\n - Both methods are using weights which are calculated based on the angle between the surface normal and the camera view direction.\n - 'Smooth' uses these calculated weights directly (0.0-1.0 range, giving gradual transitions). The transition point can be further tuned by the 'Smooth Factor' parameters.\n - Disabling 'Smooth' thresholds these weights to create a hard-edged binary mask (0.0 or 1.0).",
+        description=_DESC_SEQUENTIAL_SMOOTH,
         default=True, update=update_parameters
     )
     bpy.types.Scene.weight_exponent_mask = bpy.props.BoolProperty(
@@ -607,17 +791,17 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.sequential_factor_smooth = bpy.props.FloatProperty(
         name="Smooth Visibility Black Point",
         description="Controls the black point (start) of the Color Ramp used for the smooth visibility mask in sequential mode. Defines the weight threshold below which areas are considered fully invisible/untextured from previous views. Higher values create a sharper transition start.",
-        default=0.15, min=0.0, max=1.0, update=update_parameters
+        default=0.15, min=0.0, max=1.0, subtype='FACTOR', step=5, precision=2, update=update_parameters
     )
     bpy.types.Scene.sequential_factor_smooth_2 = bpy.props.FloatProperty(
         name="Smooth Visibility White Point",
         description="Controls the white point (end) of the Color Ramp used for the smooth visibility mask in sequential mode. Defines the weight threshold above which areas are considered fully visible/textured from previous views. Lower values create a sharper transition end.",
-        default=1.0, min=0.0, max=1.0, update=update_parameters
+        default=1.0, min=0.0, max=1.0, subtype='FACTOR', step=5, precision=2, update=update_parameters
     )
     bpy.types.Scene.sequential_factor = bpy.props.FloatProperty(
         name="Binary Visibility Threshold",
         description="Threshold value used when 'Sequential Smooth' is OFF. Calculated visibility weights below this value are treated as 0 (invisible), and those above as 1 (visible), creating a hard-edged binary mask.",
-        default=0.7, min=0.0, max=1.0, update=update_parameters
+        default=0.7, min=0.0, max=1.0, subtype='FACTOR', step=5, precision=2, update=update_parameters
     )
     bpy.types.Scene.differential_noise = bpy.props.BoolProperty(
         name="Differential Noise",
@@ -712,7 +896,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     )
     bpy.types.Scene.differential_diffusion = bpy.props.BoolProperty(
         name="Differential Diffusion",
-        description="Replace standard inpainting with a differential diffusion based workflow\n\n - Generally works better and reduces artifacts.\n - Using a Smooth Visibilty Map is recommended for Sequential Mode.",
+        description=_DESC_DIFFERENTIAL_DIFFUSION,
         default=True, update=update_parameters
     )
     bpy.types.Scene.blur_mask = bpy.props.BoolProperty(
@@ -725,7 +909,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     )
     bpy.types.Scene.blur_mask_sigma = bpy.props.FloatProperty(
         name="Blur Mask Sigma", description="Sigma for mask blurring (ComfyUI)",
-        default=1.0, min=0.1, update=update_parameters
+        default=1.0, min=0.1, step=10, precision=2, update=update_parameters
     )
     bpy.types.Scene.sequential_custom_camera_order = bpy.props.StringProperty(
         name="Custom Camera Order",
@@ -743,7 +927,7 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
         items=get_preset_items, default=0
     )
     bpy.types.Scene.active_preset = bpy.props.StringProperty(
-        name="Active Preset", default="DEFAULT"
+        name="Active Preset", default="DEFAULT", options={'HIDDEN'}
     )
 
     # ── Architecture ───────────────────────────────────────────────────
@@ -905,11 +1089,11 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.trellis2_preview_gallery_enabled = bpy.props.BoolProperty(
         name="Preview Gallery",
         description="When in prompt mode, generate multiple images with different seeds and let you pick the best one before proceeding to 3D generation",
-        default=False, update=update_parameters
+        default=False
     )
     bpy.types.Scene.trellis2_preview_gallery_count = bpy.props.IntProperty(
         name="Gallery Count", description="Number of images to generate per batch in the preview gallery",
-        default=4, min=1, max=16, update=update_parameters
+        default=4, min=1, max=16
     )
 
     # ── Qwen-specific ──────────────────────────────────────────────────
@@ -1015,7 +1199,8 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
 
     # ── Misc ───────────────────────────────────────────────────────────
     bpy.types.Scene.output_timestamp = bpy.props.StringProperty(
-        name="Output Timestamp", description="Timestamp for generation output directory", default=""
+        name="Output Timestamp", description="Timestamp for generation output directory", default="",
+        options={'HIDDEN'}
     )
     bpy.types.Scene.camera_prompts = bpy.props.CollectionProperty(
         type=CameraPromptItem, name="Camera Prompts",
@@ -1039,44 +1224,10 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     )
 
     # ── UI section toggles ─────────────────────────────────────────────
-    bpy.types.Scene.show_core_settings = bpy.props.BoolProperty(
-        name="Core Generation Settings",
-        description="Parameters used for the image generation process. Also includes LoRAs for faster generation.",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.show_lora_settings = bpy.props.BoolProperty(
-        name="LoRA Settings", description="Settings for custom LoRA management.",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.show_camera_options = bpy.props.BoolProperty(
-        name="Camera Settings", description="Camera prompt and generation order settings.",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.show_scene_understanding_settings = bpy.props.BoolProperty(
-        name="Viewpoint Blending Settings",
-        description="Settings for how the addon blends different viewpoints together.",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.show_output_material_settings = bpy.props.BoolProperty(
-        name="Output & Material Settings",
-        description="Settings for output characteristics and material handling, including texture processing and final image resolution.",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.show_image_guidance_settings = bpy.props.BoolProperty(
-        name="Image Guidance (IPAdapter & ControlNet)",
-        description="Configuration for advanced image guidance techniques, allowing more precise control via reference images or structural inputs.",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.show_masking_inpainting_settings = bpy.props.BoolProperty(
-        name="Inpainting Options",
-        description="Parameters for inpainting and mask manipulation to refine specific image areas. (Visible for UV Inpaint & Sequential modes).",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.show_mode_specific_settings = bpy.props.BoolProperty(
-        name="Generation Mode Specifics",
-        description="Parameters exclusively available for the selected Generation Mode, allowing tailored control over mode-dependent behaviors.",
-        default=False, update=update_parameters
-    )
+    for attr, name, description in _PANEL_TOGGLES:
+        setattr(bpy.types.Scene, attr, bpy.props.BoolProperty(
+            name=name, description=description, default=False
+        ))
 
     # ── Generation mode / priority ─────────────────────────────────────
     bpy.types.Scene.generation_mode = bpy.props.EnumProperty(
@@ -1117,8 +1268,8 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
     bpy.types.Scene.lora_units = bpy.props.CollectionProperty(type=LoRAUnit)
     bpy.types.Scene.controlnet_units_index = bpy.props.IntProperty(default=0)
     bpy.types.Scene.lora_units_index = bpy.props.IntProperty(default=0)
-    bpy.app.handlers.load_post.append(load_handler)
-    bpy.app.handlers.load_post.append(_sg_queue_load_handler)
+    _add_load_post_handler(load_handler)
+    _add_load_post_handler(_sg_queue_load_handler)
 
     # ── TRELLIS.2 status / flags ───────────────────────────────────────
     bpy.types.Scene.trellis2_available = bpy.props.BoolProperty(
@@ -1419,27 +1570,11 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
         ],
         default='selective', update=update_parameters
     )
-    bpy.types.Scene.pbr_tile_albedo = bpy.props.BoolProperty(
-        name="Tile Albedo", description="Tile the albedo map for higher detail",
-        default=True, update=update_parameters
-    )
-    bpy.types.Scene.pbr_tile_material = bpy.props.BoolProperty(
-        name="Tile Material", description="Tile the roughness and metallic maps (both come from the same IID-Appearance material output)",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.pbr_tile_normal = bpy.props.BoolProperty(
-        name="Tile Normal", description="Tile the normal map for higher detail",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.pbr_tile_height = bpy.props.BoolProperty(
-        name="Tile Height", description="Tile the height/displacement map for higher detail",
-        default=False, update=update_parameters
-    )
-    bpy.types.Scene.pbr_tile_emission = bpy.props.BoolProperty(
-        name="Tile Emission",
-        description="Tile the IID-Lighting residual used for emission (only applies to the Residual emission method)",
-        default=False, update=update_parameters
-    )
+    for attr, name, description, default in _PBR_TILE_TOGGLES:
+        setattr(bpy.types.Scene, attr, bpy.props.BoolProperty(
+            name=name, description=description,
+            default=default, update=update_parameters
+        ))
     bpy.types.Scene.pbr_tile_grid = bpy.props.IntProperty(
         name="Tile Grid",
         description="N\u00d7N grid size for tiling. 2 = 4 tiles (4\u00d7 detail), 3 = 9 tiles (9\u00d7 detail), 4 = 16 tiles (16\u00d7 detail). Processing time scales with N\u00b2",
@@ -1497,155 +1632,19 @@ def register_properties(update_model_list, ControlNetUnit, LoRAUnit,
 def unregister_properties(load_handler, _sg_queue_load_handler):
     """Remove all properties registered by ``register_properties``."""
 
-    if hasattr(bpy.types.Scene, 'controlnet_model_mappings'):
-        del bpy.types.Scene.controlnet_model_mappings
-    if hasattr(bpy.types.Scene, 'controlnet_mapping_index'):
-        del bpy.types.Scene.controlnet_mapping_index
+    cancel_parameter_update()
+    cancel_pending_load()
+    cancel_server_check()
 
-    _simple_scene_props = [
-        'use_flux_lora',
-        'comfyui_prompt', 'use_separate_texture_prompt', 'texture_prompt',
-        'comfyui_negative_prompt', 'model_name', 'sg_model_name_backup',
-        'seed', 'control_after_generate', 'steps', 'cfg',
-        'sampler', 'scheduler', 'show_advanced_params', 'show_generation_params',
-        'auto_rescale', 'qwen_rescale_alignment', 'auto_rescale_target_mp',
-        'generation_method', 'use_ipadapter',
-        'refine_images', 'refine_steps', 'refine_sampler', 'refine_scheduler',
-        'denoise', 'refine_cfg', 'refine_prompt', 'refine_upscale_method',
-        'generation_status', 'sg_last_gen_error', 'generation_progress',
-        'overwrite_material', 'bake_visibility_weights',
-        'discard_factor', 'discard_factor_generation_only', 'discard_factor_after_generation',
-        'weight_exponent', 'weight_exponent_generation_only', 'weight_exponent_after_generation',
-        'view_blend_use_color_match', 'view_blend_color_match_method', 'view_blend_color_match_strength',
-        'allow_modify_existing_textures', 'ask_object_prompts', 'fallback_color',
-        'controlnet_units', 'controlnet_units_index', 'lora_units', 'lora_units_index',
-        'weight_exponent_mask', 'sequential_smooth',
-        'canny_threshold_low', 'canny_threshold_high',
-        'sequential_factor_smooth', 'sequential_factor_smooth_2', 'sequential_factor',
-        'grow_mask_by', 'mask_blocky',
-        'visibility_vignette', 'visibility_vignette_width', 'visibility_vignette_softness',
-        'visibility_vignette_blur',
-        'sg_silhouette_margin', 'sg_silhouette_depth', 'sg_silhouette_rays',
-        'refine_angle_ramp_active', 'refine_angle_ramp_pos_0', 'refine_angle_ramp_pos_1',
-        'refine_feather_ramp_pos_0', 'refine_feather_ramp_pos_1',
-        'refine_edge_feather_projection', 'refine_edge_feather_width', 'refine_edge_feather_softness',
-        'differential_diffusion', 'differential_noise',
-        'blur_mask', 'blur_mask_radius', 'blur_mask_sigma',
-        'sequential_custom_camera_order',
-        'ipadapter_strength', 'ipadapter_start', 'ipadapter_end',
-        'ipadapter_image', 'ipadapter_weight_type',
-        'sequential_ipadapter', 'sequential_ipadapter_mode',
-        'sequential_desaturate_factor', 'sequential_contrast_factor',
-        'sequential_ipadapter_regenerate', 'sequential_ipadapter_regenerate_wo_controlnet',
-        'clip_skip', 'stablegen_preset', 'active_preset',
-        'model_architecture', 'architecture_mode',
-        'output_timestamp', 'camera_prompts', 'use_camera_prompts',
-        'sg_camera_order', 'sg_camera_order_index', 'sg_use_custom_camera_order',
-        'show_core_settings', 'show_lora_settings', 'show_camera_options',
-        'show_scene_understanding_settings', 'show_output_material_settings',
-        'show_image_guidance_settings', 'show_masking_inpainting_settings',
-        'show_mode_specific_settings',
-        'generation_mode', 'early_priority_strength', 'early_priority', 'texture_objects',
-        'qwen_generation_method', 'qwen_refine_use_prev_ref', 'qwen_refine_use_depth',
-        'qwen_timestep_zero_ref',
-        'qwen_guidance_map_type', 'qwen_voronoi_mode', 'qwen_context_render_mode',
-        'qwen_use_external_style_image', 'qwen_external_style_image',
-        'qwen_external_style_initial_only',
-        'qwen_use_custom_prompts', 'qwen_custom_prompt_initial',
-        'qwen_custom_prompt_seq_none', 'qwen_custom_prompt_seq_replace',
-        'qwen_custom_prompt_seq_additional',
-        'qwen_guidance_fallback_color', 'qwen_guidance_background_color',
-        'qwen_context_cleanup', 'qwen_context_cleanup_hue_tolerance',
-        'qwen_context_cleanup_value_adjust', 'qwen_context_fallback_dilation',
-        'qwen_prompt_gray_background',
-    ]
-    for prop in _simple_scene_props:
-        if hasattr(bpy.types.Scene, prop):
-            delattr(bpy.types.Scene, prop)
+    for owner, names in _PROP_NAMES:
+        for prop in names:
+            if hasattr(owner, prop):
+                delattr(owner, prop)
 
-    # --- PBR Decomposition Properties ---
-    pbr_props = [
-        'pbr_decomposition', 'pbr_albedo_source',
-        'pbr_map_albedo', 'pbr_map_roughness', 'pbr_map_metallic',
-        'pbr_map_normal', 'pbr_map_height', 'pbr_height_scale',
-        'pbr_map_ao', 'pbr_ao_samples', 'pbr_ao_distance',
-        'pbr_map_emission', 'pbr_emission_method',
-        'pbr_emission_threshold', 'pbr_emission_saturation_min',
-        'pbr_emission_value_min', 'pbr_emission_bloom',
-        'pbr_emission_strength',
-        'pbr_normal_strength', 'pbr_delight_strength',
-        'pbr_use_native_resolution', 'pbr_tiling',
-        'pbr_tile_albedo', 'pbr_tile_material', 'pbr_tile_normal', 'pbr_tile_height',
-        'pbr_tile_emission', 'pbr_tile_grid', 'pbr_tile_superres',
-        'pbr_processing_resolution', 'pbr_denoise_steps', 'pbr_ensemble_size',
-        'pbr_albedo_auto_saturation', 'pbr_albedo_saturation_mode',
-        'pbr_replace_color_with_albedo', 'pbr_auto_lighting',
-        'pbr_model_variant',  # legacy, kept for compat
-    ]
-    for prop in pbr_props:
+    for prop in _LEGACY_SCENE_PROPS:
         if hasattr(bpy.types.Scene, prop):
             delattr(bpy.types.Scene, prop)
 
-    # --- TRELLIS.2 Properties ---
-    trellis2_props = [
-        'trellis2_available', 'pbr_nodes_available',
-        'show_trellis2_params', 'show_trellis2_advanced',
-        'show_trellis2_mesh_settings', 'show_trellis2_texture_settings',
-        'show_trellis2_camera_settings',
-        'trellis2_last_input_image', 'qwen_use_trellis2_style', 'qwen_trellis2_style_initial_only',
-        'trellis2_pipeline_active', 'trellis2_pipeline_phase_start_pct',
-        'trellis2_pipeline_total_phases',
-        'trellis2_generate_from', 'trellis2_texture_mode', 'trellis2_initial_image_arch',
-        'trellis2_camera_count',
-        'trellis2_placement_mode', 'trellis2_auto_prompts',
-        'trellis2_exclude_bottom', 'trellis2_exclude_bottom_angle',
-        'trellis2_auto_aspect', 'trellis2_occlusion_mode',
-        'trellis2_consider_existing', 'trellis2_delete_cameras',
-        'trellis2_coverage_target',
-        'trellis2_max_auto_cameras', 'trellis2_fan_angle',
-        'trellis2_import_scale', 'trellis2_shade_mode',
-        'trellis2_clamp_elevation', 'trellis2_max_elevation', 'trellis2_min_elevation',
-        'trellis2_preview_gallery_enabled', 'trellis2_preview_gallery_count',
-        'trellis2_input_image', 'trellis2_batch_folder', 'trellis2_batch_count',
-        'trellis2_batch_rename_meshes',
-        'trellis2_resolution', 'trellis2_vram_mode',
-        'trellis2_attn_backend', 'trellis2_seed', 'trellis2_ss_guidance',
-        'trellis2_ss_steps', 'trellis2_shape_guidance', 'trellis2_shape_steps',
-        'trellis2_tex_guidance', 'trellis2_tex_steps', 'trellis2_max_tokens',
-        'trellis2_texture_size', 'trellis2_decimation', 'trellis2_remesh',
-        'trellis2_post_processing_enabled',
-        'trellis2_auto_lighting',
-        'trellis2_skip_texture', 'trellis2_bg_removal', 'trellis2_background_color',
-    ]
-    for prop in trellis2_props:
-        if hasattr(bpy.types.Scene, prop):
-            delattr(bpy.types.Scene, prop)
-
-    # --- Batch generation cleanup ---
-    for attr in ('sg_batch_running', 'sg_batch_index', 'sg_batch_total'):
-        if hasattr(bpy.types.WindowManager, attr):
-            delattr(bpy.types.WindowManager, attr)
-
-    # --- Scene Queue cleanup ---
-    if hasattr(bpy.types.WindowManager, 'sg_scene_queue'):
-        del bpy.types.WindowManager.sg_scene_queue
-    if hasattr(bpy.types.WindowManager, 'sg_scene_queue_index'):
-        del bpy.types.WindowManager.sg_scene_queue_index
-    if hasattr(bpy.types.WindowManager, 'sg_show_queue'):
-        del bpy.types.WindowManager.sg_show_queue
-
-    for attr in (
-        'sg_queue_gif_export', 'sg_queue_gif_duration', 'sg_queue_gif_fps',
-        'sg_queue_gif_resolution', 'sg_queue_gif_samples', 'sg_queue_gif_engine',
-        'sg_queue_gif_interpolation', 'sg_queue_gif_use_hdri',
-        'sg_queue_gif_hdri_path', 'sg_queue_gif_hdri_strength',
-        'sg_queue_gif_hdri_rotation', 'sg_queue_gif_env_mode',
-        'sg_queue_gif_denoiser', 'sg_queue_gif_use_gpu',
-        'sg_queue_gif_also_no_pbr',
-    ):
-        if hasattr(bpy.types.WindowManager, attr):
-            delattr(bpy.types.WindowManager, attr)
-
     # --- Load handlers ---
     if load_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(load_handler)
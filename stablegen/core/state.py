@@ -18,6 +18,24 @@ _cached_lora_list = [("NONE_AVAILABLE", "None available", "Fetch models from ser
 _cached_checkpoint_architecture = None
 _pending_checkpoint_refresh_architecture = None
 
+# Identifiers of the placeholder entries shown in the model dropdowns when no
+# real model is listed (server unreachable, empty list, scan errors, ...).
+_MODEL_SENTINEL_IDS = frozenset((
+    "NONE_AVAILABLE", "NONE_FOUND", "NO_SERVER", "NO_COMFYUI_DIR",
+    "NO_COMFYUI_DIR_LORA", "NO_CHECKPOINTS_SUBDIR", "NO_LORAS_SUBDIR",
+    "PERM_ERROR", "SCAN_ERROR",
+))
+
+# ControlNet enum items per unit type, built from the preferences mapping
+# table.  Keyed by unit_type -> (mapping_count, items).  Cleared whenever a
+# mapping is edited or the table is refreshed from the server.
+_controlnet_items_cache = {}
+
+
+def _invalidate_controlnet_items(self=None, context=None):
+    """Drop cached ControlNet enum items (usable as an ``update=`` callback)."""
+    _controlnet_items_cache.clear()
+
 
 # ── In-flight refresh counter ─────────────────────────────────────────────
 _pending_refreshes = 0
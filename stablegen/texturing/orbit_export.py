@@ -9,8 +9,6 @@ import bpy  # pylint: disable=import-error
 import numpy as np
 import mathutils
 from ..utils import get_dir_path, get_eevee_engine_id, sg_modal_active
-import imageio
-import imageio_ffmpeg
 
 class ExportOrbitGIF(bpy.types.Operator):
     """Exports a GIF and MP4 animation orbiting the active object"""
@@ -909,6 +907,9 @@ class ExportOrbitGIF(bpy.types.Operator):
         mp4_success = False
 
         try:
+            # Imported here so the add-on loads without imageio installed.
+            import imageio
+
             # Sort frames numerically just in case paths weren't added perfectly in order
             self._frame_paths.sort()
 
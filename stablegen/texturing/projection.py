@@ -242,11 +242,13 @@ def _bake_visibility_weights(context, objects, cameras, mat_id, stop_index=10000
                 valid &= ~near_silhouette
 
             # ── Vectorised weight + feather ────────────────────────────
-            w = np.power(np.maximum(dot_dn, 1e-12), power_exponent)
+            # Only visible vertices receive a weight, so evaluate the
+            # power curve and feather on that subset alone.
+            w = np.power(np.maximum(dot_dn[valid], 1e-12), power_exponent)
 
             if feather_width > 0:
-                nx   = np.abs(x_proj) / filmw
-                ny   = np.abs(y_proj) / filmh
+                nx   = np.abs(x_proj[valid]) / filmw
+                ny   = np.abs(y_proj[valid]) / filmh
                 edge = np.maximum(nx, ny)
                 low  = 1.0 - feather_width
                 need_feather = edge > low
@@ -256,7 +258,7 @@ def _bake_visibility_weights(context, objects, cameras, mat_id, stop_index=10000
                               max(feather_gamma, 0.01))
                 w  = np.where(need_feather, w * ff, w)
 
-            weights[valid] = w[valid]
+            weights[valid] = w
 
             # Store as FLOAT POINT-domain attribute on the *base* mesh
             attr_name = f"_SG_VisWeight_{cam_idx}_{mat_id}"
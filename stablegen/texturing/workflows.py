@@ -627,7 +627,7 @@ class _TexturingWorkflowMixin:
         if context.scene.use_camera_prompts and self.operator._cameras and self.operator._current_image < len(self.operator._cameras):
             current_camera_name = self.operator._cameras[self.operator._current_image].name
             # Find the prompt in the collection
-            prompt_item = next((item for item in context.scene.camera_prompts if item.name == current_camera_name), None)
+            prompt_item = context.scene.camera_prompts.get(current_camera_name)
             if prompt_item and prompt_item.prompt:
                 view_desc = prompt_item.prompt
                 # Prepend the view description
@@ -915,8 +915,7 @@ class _TexturingWorkflowMixin:
                 and self.operator._cameras
                 and self.operator._current_image < len(self.operator._cameras)):
             cam_name = self.operator._cameras[self.operator._current_image].name
-            prompt_item = next(
-                (p for p in context.scene.camera_prompts if p.name == cam_name), None)
+            prompt_item = context.scene.camera_prompts.get(cam_name)
             if prompt_item and prompt_item.prompt:
                 camera_suffix = f", {prompt_item.prompt}"
 
@@ -1917,7 +1916,7 @@ class _TexturingWorkflowMixin:
         if context.scene.use_camera_prompts and context.scene.generation_method in ['separate', 'sequential', 'refine', 'local_edit'] and self.operator._cameras and self.operator._current_image < len(self.operator._cameras):
             current_camera_name = self.operator._cameras[self.operator._current_image].name
             # Find the prompt in the collection
-            prompt_item = next((item for item in context.scene.camera_prompts if item.name == current_camera_name), None)
+            prompt_item = context.scene.camera_prompts.get(current_camera_name)
             if prompt_item and prompt_item.prompt:
                 view_desc = prompt_item.prompt
                 # Prepend the view description
@@ -2316,7 +2315,7 @@ class _TexturingWorkflowMixin:
         if context.scene.use_camera_prompts and context.scene.generation_method in ['separate', 'sequential', 'refine', 'local_edit'] and self.operator._cameras and self.operator._current_image < len(self.operator._cameras):
             current_camera_name = self.operator._cameras[self.operator._current_image].name
             # Find the prompt in the collection
-            prompt_item = next((item for item in context.scene.camera_prompts if item.name == current_camera_name), None)
+            prompt_item = context.scene.camera_prompts.get(current_camera_name)
             if prompt_item and prompt_item.prompt:
                 view_desc = prompt_item.prompt
                 # Prepend the view description
@@ -2553,7 +2552,7 @@ class _TexturingWorkflowMixin:
         if context.scene.use_camera_prompts and context.scene.generation_method in ['separate', 'sequential', 'refine', 'local_edit'] and self.operator._cameras and self.operator._current_image < len(self.operator._cameras):
             current_camera_name = self.operator._cameras[self.operator._current_image].name
             # Find the prompt in the collection
-            prompt_item = next((item for item in context.scene.camera_prompts if item.name == current_camera_name), None)
+            prompt_item = context.scene.camera_prompts.get(current_camera_name)
             if prompt_item and prompt_item.prompt:
                 view_desc = prompt_item.prompt
                 # Prepend the view description
@@ -2759,7 +2758,7 @@ class _TexturingWorkflowMixin:
         if context.scene.use_camera_prompts and context.scene.generation_method in ['separate', 'sequential', 'refine', 'local_edit', 'grid'] and self.operator._cameras and self.operator._current_image < len(self.operator._cameras):
             current_camera_name = self.operator._cameras[self.operator._current_image].name
             # Find the prompt in the collection
-            prompt_item = next((item for item in context.scene.camera_prompts if item.name == current_camera_name), None)
+            prompt_item = context.scene.camera_prompts.get(current_camera_name)
             if prompt_item and prompt_item.prompt:
                 view_desc = prompt_item.prompt
                 # Prepend the view description
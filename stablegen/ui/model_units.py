@@ -9,6 +9,9 @@ Contains:
 - ``update_model_list``, ``update_union``, ``update_controlnet``
 """
 
+import sys
+from functools import lru_cache
+
 import bpy  # pylint: disable=import-error
 
 from .presets import update_parameters
@@ -21,25 +24,43 @@ from ..core.state import (
     _cached_lora_list,
     _dec_pending_refreshes,
     _inc_pending_refreshes,
+    _MODEL_SENTINEL_IDS,
     _run_async,
 )
 
 
 # ── Enum callbacks for model dropdowns ─────────────────────────────────────
 
+# Fallback item lists are module constants so Blender always receives the
+# same Python objects back from the ``items=`` callbacks.
+_NONE_AVAILABLE_ITEMS = [("NONE_AVAILABLE", "None available", "Fetch models from server")]
+_NO_PREFS_ITEMS = [("NO_PREFS", "Addon Error", "Could not access preferences")]
+_REFRESH_ITEMS = [("REFRESH", "Refresh List in Prefs", "Fetch models via Preferences")]
+
+
 def update_model_list(self, context):
     """Returns the cached list of checkpoint/unet models."""
     from ..core import state as _state
     if not _state._cached_checkpoint_list:
-        return [("NONE_AVAILABLE", "None available", "Fetch models from server")]
+        return _NONE_AVAILABLE_ITEMS
     return _state._cached_checkpoint_list
 
 
+# Substrings that mark a ControlNet model as a multi-type "union" model.
+_UNION_TAGS = ("union", "promax")
+
+
+@lru_cache(maxsize=256)
+def _is_union_model(model_name):
+    name = model_name.lower()
+    return any(tag in name for tag in _UNION_TAGS)
+
+
 def update_union(self, context):
-    if "union" in self.model_name.lower() or "promax" in self.model_name.lower():
-        self.is_union = True
-    else:
-        self.is_union = False
+    is_union = _is_union_model(self.model_name)
+    # Skip the RNA write (and its redraw) when re-selecting the same kind
+    if self.is_union != is_union:
+        self.is_union = is_union
 
 
 def update_controlnet(self, context):
@@ -49,31 +70,41 @@ def update_controlnet(self, context):
 
 
 def get_controlnet_models(context, unit_type):
-    """Get available ControlNet models suitable for *unit_type*."""
-    items = []
+    """Get available ControlNet models suitable for *unit_type*.
+
+    The item list is cached per unit type (see
+    ``state._controlnet_items_cache``) so redraws don't walk the mapping
+    collection, and Blender keeps receiving the same Python objects.
+    """
+    from ..core import state as _state
     prefs = context.preferences.addons.get(ADDON_PKG)
     if not prefs:
-        return [("NO_PREFS", "Addon Error", "Could not access preferences")]
+        return _NO_PREFS_ITEMS
 
     mappings = prefs.preferences.controlnet_model_mappings
+    num_mappings = len(mappings)
 
-    if not mappings:
-        return [("REFRESH", "Refresh List in Prefs", "Fetch models via Preferences")]
-
-    prop_name = f"supports_{unit_type}"
-
-    found_count = 0
-    for item in mappings:
-        if hasattr(item, prop_name):
-            if getattr(item, prop_name):
-                items.append((item.name, item.name, f"ControlNet: {item.name}"))
-                found_count += 1
+    cached = _state._controlnet_items_cache.get(unit_type)
+    if cached is not None and cached[0] == num_mappings:
+        return cached[1]
 
-    if found_count == 0:
-        return [("NO_ASSIGNED", f"No models assigned to '{unit_type}'",
-                 "Assign types in Addon Preferences or Refresh")]
-
-    items.sort(key=lambda x: x[1])
+    items = []
+    if not mappings:
+        items = _REFRESH_ITEMS
+    else:
+        prop_name = f"supports_{unit_type}"
+        for item in mappings:
+            if getattr(item, prop_name, False):
+                name = sys.intern(item.name)
+                items.append((name, name, f"ControlNet: {name}"))
+
+        if not items:
+            items = [("NO_ASSIGNED", f"No models assigned to '{unit_type}'",
+                      "Assign types in Addon Preferences or Refresh")]
+        else:
+            items.sort(key=lambda x: x[1])
+
+    _state._controlnet_items_cache[unit_type] = (num_mappings, items)
     return items
 
 
@@ -81,10 +112,25 @@ def get_lora_models(self, context):
     """Returns the cached list of LoRA models."""
     from ..core import state as _state
     if not _state._cached_lora_list:
-        return [("NONE_AVAILABLE", "None available", "Fetch models from server")]
+        return _NONE_AVAILABLE_ITEMS
     return _state._cached_lora_list
 
 
+# (source item list, real LoRA identifiers) for the last list seen, so
+# AddLoRAUnit.poll doesn't re-filter the placeholders on every redraw.
+_lora_ids_memo = (None, ())
+
+
+def _available_lora_ids(context):
+    """Identifiers of the real LoRAs in the cached list (placeholders removed)."""
+    global _lora_ids_memo
+    items = get_lora_models(context.scene, context)
+    if _lora_ids_memo[0] is not items:
+        _lora_ids_memo = (items, tuple(item[0] for item in items
+                                       if item[0] not in _MODEL_SENTINEL_IDS))
+    return _lora_ids_memo[1]
+
+
 # ── PropertyGroups ─────────────────────────────────────────────────────────
 
 class ControlNetUnit(bpy.types.PropertyGroup):
@@ -308,12 +354,11 @@ class RefreshLoRAList(bpy.types.Operator):
                 valid_ids = {it[0] for it in _state._cached_lora_list}
                 placeholder = next((it[0] for it in _state._cached_lora_list
                                     if it[0].startswith("NO_") or it[0] == "NONE_FOUND"), None)
-                indices_to_remove = []
-                for i, unit in enumerate(scene.lora_units):
-                    if unit.model_name not in valid_ids or unit.model_name == placeholder:
-                        indices_to_remove.append(i)
-                for i in sorted(indices_to_remove, reverse=True):
-                    scene.lora_units.remove(i)
+                # Walk backwards so removals don't shift indices still to visit
+                for i in range(len(scene.lora_units) - 1, -1, -1):
+                    model_name = scene.lora_units[i].model_name
+                    if model_name not in valid_ids or model_name == placeholder:
+                        scene.lora_units.remove(i)
 
                 num_loras = len(scene.lora_units)
                 if scene.lora_units_index >= num_loras:
@@ -333,6 +378,23 @@ class RefreshLoRAList(bpy.types.Operator):
 
 # ── Add / Remove operators ─────────────────────────────────────────────────
 
+def _tag_panel_redraw(context):
+    """Redraw only the 3D-view sidebar regions that host the StableGen panel."""
+    screen = context.screen
+    if screen is None:
+        return
+    for area in screen.areas:
+        if area.type != 'VIEW_3D':
+            continue
+        for region in area.regions:
+            if region.type == 'UI':
+                region.tag_redraw()
+                break
+
+
+_CONTROLNET_TYPE_ITEMS = (('depth', 'Depth', ''), ('canny', 'Canny', ''), ('normal', 'Normal', ''))
+
+
 class AddControlNetUnit(bpy.types.Operator):
     bl_idname = "stablegen.add_controlnet_unit"
     bl_label = "Add ControlNet Unit"
@@ -340,7 +402,7 @@ class AddControlNetUnit(bpy.types.Operator):
 
     unit_type: bpy.props.EnumProperty(
         name="Type",
-        items=[('depth', 'Depth', ''), ('canny', 'Canny', ''), ('normal', 'Normal', '')],
+        items=_CONTROLNET_TYPE_ITEMS,
         default='depth',
         update=update_parameters
     )  # type: ignore
@@ -368,21 +430,19 @@ class AddControlNetUnit(bpy.types.Operator):
 
     def execute(self, context):
         units = context.scene.controlnet_units
-        for unit in units:
-            if unit.unit_type == self.unit_type:
-                self.report({'WARNING'}, f"Unit '{self.unit_type}' already exists.")
-                return {'CANCELLED'}
+        if self.unit_type in {unit.unit_type for unit in units}:
+            self.report({'WARNING'}, f"Unit '{self.unit_type}' already exists.")
+            return {'CANCELLED'}
         new_unit = units.add()
         new_unit.unit_type = self.unit_type
         new_unit.model_name = self.model_name
         new_unit.strength = 0.5
         new_unit.start_percent = 0.0
         new_unit.end_percent = 1.0
-        if "union" in new_unit.model_name.lower() or "promax" in new_unit.model_name.lower():
+        if _is_union_model(new_unit.model_name):
             new_unit.is_union = True
         context.scene.controlnet_units_index = len(units) - 1
-        for area in context.screen.areas:
-            area.tag_redraw()
+        _tag_panel_redraw(context)
         return {'FINISHED'}
 
 
@@ -393,7 +453,7 @@ class RemoveControlNetUnit(bpy.types.Operator):
 
     unit_type: bpy.props.EnumProperty(
         name="Type",
-        items=[('depth', 'Depth', ''), ('canny', 'Canny', ''), ('normal', 'Normal', '')],
+        items=_CONTROLNET_TYPE_ITEMS,
         default='depth',
         update=update_parameters
     )  # type: ignore
@@ -415,14 +475,13 @@ class RemoveControlNetUnit(bpy.types.Operator):
 
     def execute(self, context):
         units = context.scene.controlnet_units
-        for index, unit in enumerate(units):
-            if unit.unit_type == self.unit_type:
-                units.remove(index)
-                context.scene.controlnet_units_index = min(max(0, index - 1), len(units) - 1)
-                update_parameters(self, context)
-                for area in context.screen.areas:
-                    area.tag_redraw()
-                return {'FINISHED'}
+        index = next((i for i, unit in enumerate(units) if unit.unit_type == self.unit_type), None)
+        if index is not None:
+            units.remove(index)
+            context.scene.controlnet_units_index = min(max(0, index - 1), len(units) - 1)
+            update_parameters(self, context)
+            _tag_panel_redraw(context)
+            return {'FINISHED'}
         self.report({'WARNING'}, f"No unit of type '{self.unit_type}' found.")
         return {'CANCELLED'}
 
@@ -435,24 +494,13 @@ class AddLoRAUnit(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         scene = context.scene
-        addon_prefs = context.preferences.addons.get(ADDON_PKG)
-
-        if not addon_prefs:
-            return False
-        addon_prefs = addon_prefs.preferences
-
-        lora_enum_items = get_lora_models(scene, context)
-
-        placeholder_ids = {"NONE_AVAILABLE", "NO_COMFYUI_DIR_LORA", "NO_LORAS_SUBDIR",
-                          "PERM_ERROR", "SCAN_ERROR", "NONE_FOUND"}
-
-        available_lora_files_count = sum(1 for item in lora_enum_items if item[0] not in placeholder_ids)
+        num_current_lora_units = len(scene.lora_units)
+        available_lora_files_count = len(_available_lora_ids(context))
 
         if available_lora_files_count == 0:
             cls.poll_message_set("No LoRA model files found in any specified directory (including subdirectories).")
             return False
 
-        num_current_lora_units = len(scene.lora_units)
         if num_current_lora_units >= available_lora_files_count:
             cls.poll_message_set("All available distinct LoRA models appear to have corresponding units.")
             return False
@@ -463,40 +511,26 @@ class AddLoRAUnit(bpy.types.Operator):
         loras = context.scene.lora_units
         new_lora = loras.add()
 
-        all_lora_enum_items = get_lora_models(context.scene, context)
-
-        placeholder_ids = {"NONE_AVAILABLE", "NO_COMFYUI_DIR_LORA", "NO_LORAS_SUBDIR",
-                          "PERM_ERROR", "SCAN_ERROR", "NONE_FOUND"}
-        available_lora_identifiers = [item[0] for item in all_lora_enum_items if item[0] not in placeholder_ids]
+        available_lora_identifiers = _available_lora_ids(context)
 
         if available_lora_identifiers:
-            current_lora_model_identifiers_in_use = {unit.model_name for unit in loras
-                                                     if unit.model_name and unit.model_name not in placeholder_ids}
-
-            assigned_model = None
-            for lora_id in available_lora_identifiers:
-                if lora_id not in current_lora_model_identifiers_in_use:
-                    assigned_model = lora_id
-                    break
+            taken = {unit.model_name for unit in loras
+                     if unit.model_name and unit.model_name not in _MODEL_SENTINEL_IDS}
+            # Prefer the first LoRA not yet in the chain; fall back to the first one.
+            assigned_model = next((lora_id for lora_id in available_lora_identifiers
+                                   if lora_id not in taken), available_lora_identifiers[0])
 
-            if not assigned_model:
-                assigned_model = available_lora_identifiers[0]
-
-            if assigned_model:
-                try:
-                    new_lora.model_name = assigned_model
-                except TypeError:
-                    print(f"[StableGen] AddLoRAUnit Execute: TypeError assigning model '{assigned_model}'. Enum might not be ready.")
+            try:
+                new_lora.model_name = assigned_model
+            except TypeError:
+                print(f"[StableGen] AddLoRAUnit Execute: TypeError assigning model '{assigned_model}'. Enum might not be ready.")
 
         new_lora.model_strength = 1.0
         new_lora.clip_strength = 1.0
         context.scene.lora_units_index = len(loras) - 1
 
         update_parameters(self, context)
-
-        for area in context.screen.areas:
-            if area.type in ('VIEW_3D', 'PROPERTIES'):
-                area.tag_redraw()
+        _tag_panel_redraw(context)
 
         return {'FINISHED'}
 
@@ -520,8 +554,7 @@ class RemoveLoRAUnit(bpy.types.Operator):
             loras.remove(index)
             context.scene.lora_units_index = min(max(0, index - 1), len(loras) - 1)
             update_parameters(self, context)
-            for area in context.screen.areas:
-                area.tag_redraw()
+            _tag_panel_redraw(context)
             return {'FINISHED'}
         self.report({'WARNING'}, "No LoRA unit selected or list is empty.")
         return {'CANCELLED'}
@@ -190,10 +190,32 @@ GEN_PARAMETERS = [
     "pbr_albedo_saturation_mode",
 ]
 
+# Compared instead of GEN_PARAMETERS when neither the scene nor the preset
+# refines: the refine_* settings are inert then, and the scene defaults for
+# the refine sampler/scheduler differ from the presets' stored values.
+_PARAMETERS_WITHOUT_REFINE = [
+    key for key in GEN_PARAMETERS
+    if key == "refine_images" or not key.startswith("refine_")
+]
+
 # ── Preset diff preview helpers ──────────────────────────────────────────
 
 
+# Built preset enum items.  Kept in a module global so Blender's references
+# to the strings stay valid, and rebuilt only when PRESETS is edited.
+_preset_items_cache = None
+
+
+def _invalidate_preset_items():
+    global _preset_items_cache
+    _preset_items_cache = None
+
+
 def get_preset_items(self, context):
+    global _preset_items_cache
+    if _preset_items_cache is not None:
+        return _preset_items_cache
+
     # Group presets by architecture for easier navigation.
     _ARCH_GROUP_ORDER = [
         ('sdxl',            'SDXL / FLUX.1'),
@@ -236,20 +258,57 @@ def get_preset_items(self, context):
 
     items.append(('', '', ''))                  # separator before Custom
     items.append(('CUSTOM', 'Custom', 'Custom configuration'))
+    _preset_items_cache = items
     return items
 
+# ── Preset matching ──────────────────────────────────────────────────────
+# Nearly every scene property calls ``update_parameters`` on change, so the
+# actual matching runs from a short timer: a slider drag or a preset being
+# applied collapses into a single pass instead of one per property write.
+
+_PARAM_UPDATE_DELAY = 0.05
+
+
+def _flush_parameter_update():
+    scene = getattr(bpy.context, "scene", None)
+    if scene is not None:
+        _match_preset(scene)
+    return None
+
+
 def update_parameters(self, context):
-    scene = context.scene
+    """Schedule a preset re-match for the current scene (debounced)."""
+    # Ask Blender rather than keep a flag: a file load drops the timer
+    if bpy.app.timers.is_registered(_flush_parameter_update):
+        return
+    bpy.app.timers.register(_flush_parameter_update, first_interval=_PARAM_UPDATE_DELAY)
+
+
+def cancel_parameter_update():
+    """Drop a pending debounced re-match (used when unregistering)."""
+    if bpy.app.timers.is_registered(_flush_parameter_update):
+        bpy.app.timers.unregister(_flush_parameter_update)
+
+
+def update_parameters_now(context):
+    """Re-match the active preset immediately, bypassing the debounce."""
+    _match_preset(context.scene)
+
+
+def _match_preset(scene):
     # Build a dictionary of current parameter values
     current = {key: getattr(scene, key) for key in GEN_PARAMETERS if hasattr(scene, key)}
     
     # Compare current values with every stock preset's stored values
     for name, preset in PRESETS.items():
+        keys = GEN_PARAMETERS
+        if not current.get("refine_images") and not preset.get("refine_images"):
+            keys = _PARAMETERS_WITHOUT_REFINE
         # First check regular parameters
         if all(
             (lambda v1, v2: math.isclose(v1, v2, rel_tol=1e-7, abs_tol=0.0) if isinstance(v1, (int, float)) and isinstance(v2, (int, float)) else v1 == v2)
             (current.get(key), preset.get(key))
-            for key in GEN_PARAMETERS if key in preset
+            for key in keys if key in preset
         ):
             units_match = True
 
@@ -447,7 +506,7 @@ class ApplyPreset(bpy.types.Operator):
             self.report({'INFO'}, "Custom preset active.")
         
         # Force update to ensure preset detection is correct after list changes
-        update_parameters(self, context)
+        update_parameters_now(context)
 
         return {'FINISHED'}
 
@@ -542,7 +601,8 @@ class SavePreset(bpy.types.Operator):
 
             # Add LoRA units to the preset
             PRESETS[key]["lora_units"] = lora_units_data
-        
+
+        _invalidate_preset_items()
         scene.stablegen_preset = key
         scene.active_preset = key
         self.report({'INFO'}, f"Preset '{self.preset_name}' saved.")
@@ -592,9 +652,10 @@ class DeletePreset(bpy.types.Operator):
         preset = context.scene.stablegen_preset
         if preset in PRESETS:
             del PRESETS[preset]
+            _invalidate_preset_items()
             context.scene.stablegen_preset = "CUSTOM"
             self.report({'INFO'}, f"Preset '{preset}' deleted.")
-            update_parameters(self, context)
+            update_parameters_now(context)
             return {'FINISHED'}
         else:
             self.report({'WARNING'}, "Preset not found.")
@@ -573,16 +573,15 @@ class SceneQueueInvalidate(bpy.types.Operator):
         try:
             fp = _sg_queue_filepath()
             if os.path.isfile(fp):
-                import json as _json
                 with open(fp, 'r', encoding='utf-8') as f:
-                    data = _json.load(f)
+                    data = json.load(f)
                 items_list = data.get("items", data) if isinstance(data, dict) else data
                 if isinstance(items_list, list) and idx < len(items_list):
                     items_list[idx]["status"] = "pending"
                     items_list[idx]["retries"] = 0
                     items_list[idx]["error_reason"] = ""
                 with open(fp, 'w', encoding='utf-8') as f:
-                    _json.dump(data, f)
+                    json.dump(data, f)
                 print(f"[Queue] Marked item {idx} as pending in queue JSON")
         except Exception as e:
             print(f"[Queue] Warning: could not update queue JSON: {e}")